@@ -45,6 +45,24 @@ T = TypeVar("T")
 logger = logging.getLogger("pylabrobot")
 
 
+def _build_c0_error_regex() -> "re.Pattern[str]":
+  # C0 sends errors as er##/##. P1 raises errors as er## where the first group is the error
+  # code, and the second group is the trace information.
+  # Beyond that, specific errors may be added for individual channels and modules. These
+  # are formatted as P1##/## H0##/##, etc. These items are added programmatically as
+  # named capturing groups to the regex.
+  exp = r"er(?P<C0>[0-9]{2}/[0-9]{2})"
+  for module in ["X0", "I0", "W1", "W2", "T1", "T2", "R0", "P1", "P2", "P3", "P4", "P5", "P6",
+                 "P7", "P8", "P9", "PA", "PB", "PC", "PD", "PE", "PF", "PG", "H0", "HW", "HU",
+                 "HV", "N0", "D0", "NP", "M1"]:
+    exp += f" ?(?:{module}(?P<{module}>[0-9]{{2}}/[0-9]{{2}}))?"
+  return re.compile(exp)
+
+
+# Compiled once, because every firmware response from the master module is checked against it.
+_C0_ERROR_RE = _build_c0_error_regex()
+
+
 def need_iswap_parked(method: Callable):
   """Ensure that the iSWAP is in parked position before running command.
 
@@ -1168,18 +1186,7 @@ class STAR(HamiltonLiquidHandler):
     # Parse errors.
     module = resp[:2]
     if module == "C0":
-      # C0 sends errors as er##/##. P1 raises errors as er## where the first group is the error
-      # code, and the second group is the trace information.
-      # Beyond that, specific errors may be added for individual channels and modules. These
-      # are formatted as P1##/## H0##/##, etc. These items are added programmatically as
-      # named capturing groups to the regex.
-
-      exp = r"er(?P<C0>[0-9]{2}/[0-9]{2})"
-      for module in ["X0", "I0", "W1", "W2", "T1", "T2", "R0", "P1", "P2", "P3", "P4", "P5", "P6",
-                    "P7", "P8", "P9", "PA", "PB", "PC", "PD", "PE", "PF", "PG", "H0", "HW", "HU",
-                    "HV", "N0", "D0", "NP", "M1"]:
-        exp += f" ?(?:{module}(?P<{module}>[0-9]{{2}}/[0-9]{{2}}))?"
-      errors = re.search(exp, resp)
+      errors = _C0_ERROR_RE.search(resp)
     else:
       # Other modules send errors as er##, and do not contain slave errors.
       exp = f"er(?P<{module}>[0-9]{{2}})"
@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from typing import Optional, Dict, Any, cast
 import urllib.parse
 
@@ -71,12 +73,16 @@ class HTTPBackend(SerializingBackend):
     command = command.replace("_", "-")
     url = urllib.parse.urljoin(self.url, command)
 
-    resp = self.session.post(
+    # `requests` is blocking, so run the request in the default executor to avoid stalling the
+    # event loop for the duration of the round trip.
+    loop = asyncio.get_event_loop()
+    resp = await loop.run_in_executor(None, functools.partial(
+      self.session.post,
       url,
       json=data,
       headers={
         "User-Agent": f"pylabrobot/{STANDARD_FORM_JSON_VERSION}",
-      })
+      }))
     return cast(dict, resp.json())
 
   async def setup(self):
@@ -85,4 +91,6 @@ class HTTPBackend(SerializingBackend):
 
   async def stop(self):
     await super().stop()
+    if self.session is not None:
+      self.session.close()
     self.session = None
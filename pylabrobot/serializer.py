@@ -1,6 +1,7 @@
 """ A simple JSON serializer. """
 
 import enum
+import functools
 import inspect
 import sys
 from typing import Any, Dict, List, Union, cast
@@ -14,6 +15,7 @@ else:
 JSON: TypeAlias = Union[Dict[str, "JSON"], List["JSON"], str, int, float, bool, None]
 
 
+@functools.lru_cache(maxsize=None)
 def get_plr_class_from_string(klass_type: str):
   # pylint: disable=import-outside-toplevel, cyclic-import
   import pylabrobot.resources as resource_module
@@ -59,12 +59,16 @@ class TemperatureController(Machine):
     """
     if self.target_temperature is None:
       raise RuntimeError("Target temperature is not set.")
-    start = time.time()
-    while time.time() - start < timeout:
+    # Poll with exponential backoff, so that short waits return quickly while long ramps are still
+    # polled at most once per second.
+    delay = 0.1
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
       temperature = await self.get_temperature()
       if abs(temperature - self.target_temperature) < tolerance:
         return
-      await asyncio.sleep(1.0)
+      await asyncio.sleep(delay)
+      delay = min(delay * 1.7, 1.0)
     raise TimeoutError(f"Temperature did not reach target temperature within {timeout} seconds.")
 
   async def deactivate(self):